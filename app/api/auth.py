@@ -13,8 +13,10 @@ Authorization: Bearer <token>
 Тонкости:
 - сравнение токенов делаем через secrets.compare_digest, чтобы избежать
   тайминговых атак на сравнение строк,
-- схема HTTPBearer объявлена с auto_error=False, чтобы самим контролировать
-  формат ответа и не получать “магические” ошибки от middleware.
+- ожидаемый токен кодируется в bytes один раз при старте (см. factory.py),
+  а на запросе сравниваются уже bytes,
+- заголовок Authorization разбираем сами, без HTTPBearer: так мы сами
+  контролируем формат ответа и не создаём лишних объектов на каждый запрос.
 """
 
 from __future__ import annotations
@@ -22,12 +24,19 @@ from __future__ import annotations
 import secrets
 from dataclasses import dataclass
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import HTTPException, status
 
-from app.config import Settings
+# Префикс заголовка в нижнем регистре и его длина: схема сравнивается
+# без учёта регистра одним срезом, без split/regex на каждый запрос.
+_BEARER_PREFIX = "bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
 
-_bearer_scheme = HTTPBearer(auto_error=False)
+# Ответ 401 всегда одинаковый, поэтому исключение создаётся один раз и
+# переиспользуется: отказ (например, при переборе токенов) ничего не аллоцирует.
+_UNAUTHORIZED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Unauthorized",
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,24 +51,22 @@ class AuthContext:
     subject: str
 
 
-def require_auth(
-    settings: Settings,
-    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
-) -> AuthContext:
+def require_auth(api_token_bytes: bytes, authorization: str | None) -> AuthContext:
     """Проверить, что Bearer-токен валиден, и вернуть контекст аутентификации."""
 
-    if credentials is None or credentials.scheme.lower() != "bearer":
+    # Формат заголовка: "Bearer <token>", токен не может быть пустым.
+    if (
+        not authorization
+        or len(authorization) <= _BEARER_PREFIX_LEN
+        or authorization[:_BEARER_PREFIX_LEN].lower() != _BEARER_PREFIX
+    ):
         # Нет заголовка Authorization или неправильная схема — считаем неавторизованным.
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized",
-        )
+        # with_traceback(None): traceback прошлого raise не должен накапливаться.
+        raise _UNAUTHORIZED.with_traceback(None)
 
-    if not secrets.compare_digest(credentials.credentials, settings.api_token):
+    token = authorization[_BEARER_PREFIX_LEN:].encode("utf-8")
+    if not secrets.compare_digest(token, api_token_bytes):
         # Токен передан, но не совпал с ожидаемым — тоже 401.
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized",
-        )
+        raise _UNAUTHORIZED.with_traceback(None)
 
     return AuthContext(subject="api_token")
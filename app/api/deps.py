@@ -3,9 +3,13 @@
 Здесь описаны функции, которые FastAPI использует как dependency injection.
 Идея проста:
 - всё состояние приложения складываем в app.state при создании (см. factory.py),
+  основные компоненты — одним объектом AppCtx в app.state.ctx,
 - на каждом запросе зависимости вытаскивают нужный объект из Request,
 - роуты объявляют нужные зависимости через Depends(...).
 
+Все зависимости объявлены как async def: они только читают app.state и не
+блокируют, поэтому FastAPI вызывает их прямо в event loop, без threadpool.
+
 Плюсы такого подхода:
 - нет глобальных переменных/синглтонов,
 - тесты могут создавать приложение с любыми настройками,
@@ -14,37 +18,61 @@
 
 from __future__ import annotations
 
-from typing import cast
+from dataclasses import dataclass
 
-from fastapi import Depends, Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Request
 
 from app.api.auth import AuthContext, require_auth
 from app.config import Settings
 from app.domain.devices import DeviceRegistry
+from app.domain.scenarios import ScenarioRegistry
+
+
+@dataclass(frozen=True, slots=True)
+class AppCtx:
+    """Компоненты приложения, собранные в один объект.
+
+Роуту, которому нужно несколько компонентов сразу (например, настройки и
+реестр), достаточно одной зависимости get_ctx вместо цепочки Depends.
+"""
 
-_bearer_scheme = HTTPBearer(auto_error=False)
+    settings: Settings
+    registry: DeviceRegistry
+    scenarios: ScenarioRegistry
 
 
-def get_settings(request: Request) -> Settings:
-    """Получить настройки из состояния приложения."""
+async def get_ctx(request: Request) -> AppCtx:
+    """Получить контекст приложения из состояния приложения."""
 
-    # В factory.py это кладётся в app.state.settings.
-    return cast(Settings, request.app.state.settings)
+    # В factory.py это кладётся в app.state.ctx.
+    ctx: AppCtx = request.app.state.ctx
+    return ctx
 
 
-def get_registry(request: Request) -> DeviceRegistry:
+async def get_registry(request: Request) -> DeviceRegistry:
     """Получить реестр устройств из состояния приложения."""
 
-    # В factory.py это кладётся в app.state.registry.
-    return cast(DeviceRegistry, request.app.state.registry)
+    ctx: AppCtx = request.app.state.ctx
+    return ctx.registry
 
 
-def get_auth(
-    settings: Settings = Depends(get_settings),
-    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
-) -> AuthContext:
-    """Получить контекст аутентификации для запроса."""
+async def get_scenarios(request: Request) -> ScenarioRegistry:
+    """Получить реестр сценариев из состояния приложения."""
+
+    ctx: AppCtx = request.app.state.ctx
+    return ctx.scenarios
+
+
+async def auth_dep(request: Request) -> AuthContext:
+    """Получить контекст аутентификации для запроса.
+
+Это единственная зависимость auth для роутов: она сама читает заголовок
+Authorization и готовый токен из app.state, без цепочки вложенных Depends.
+"""
 
     # Единственная точка входа в auth для роутов — require_auth.
-    return require_auth(settings, credentials)
+    # Токен уже закодирован в bytes при старте (app.state.api_token_bytes),
+    # поэтому на запросе не трогаем Settings.
+    return require_auth(
+        request.app.state.api_token_bytes, request.headers.get("authorization")
+    )
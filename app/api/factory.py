@@ -14,7 +14,8 @@
 
 Ключевые функции:
 - build_registry(): создаёт реестр устройств (сейчас одно LED-устройство),
-- create_app(): создаёт FastAPI, вешает роутеры и middleware.
+- create_app(): создаёт FastAPI, вешает роутеры и middleware,
+- uvicorn_kwargs(): параметры сервера Uvicorn для запуска приложения.
 """
 
 from __future__ import annotations
@@ -23,8 +24,10 @@ import logging
 import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import Any
 
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.responses import Response
 
@@ -35,11 +38,25 @@ from app.gpio.factory import create_pwm_output
 from app.gpio.led import LedController
 from app.logging_config import configure_logging
 
+from .deps import AppCtx
 from .routes_led import router as led_router
 from .routes_scenarios import router as scenarios_router
 from .routes_system import router as system_router
 from .routes_web import router as web_router
 
+# Web UI лежит рядом с Python-пакетом (app/web) и раздаётся как статика.
+# Путь вычисляем один раз на импорт, а не при каждом вызове create_app().
+_WEB_DIR = Path(__file__).resolve().parents[1] / "web"
+
+# Все роутеры собираются в один корневой роутер один раз на импорт.
+# create_app() (в тестах — многократно) подключает его одним include_router,
+# не пересобирая маршруты из четырёх роутеров каждый раз.
+_root_router = APIRouter()
+_root_router.include_router(web_router)
+_root_router.include_router(system_router)
+_root_router.include_router(led_router)
+_root_router.include_router(scenarios_router)
+
 
 def build_registry(settings: Settings) -> DeviceRegistry:
     """Собрать реестр по умолчанию с одним LED-устройством.
@@ -55,6 +72,7 @@ def build_registry(settings: Settings) -> DeviceRegistry:
         settings.gpio_backend,
         pin=settings.led_gpio_pin,
         frequency_hz=settings.pwm_frequency_hz,
+        thread_safe=not settings.mock_single_thread,
     )
     controller = LedController(pwm=pwm)
     registry.register_led(
@@ -63,6 +81,23 @@ def build_registry(settings: Settings) -> DeviceRegistry:
     return registry
 
 
+def uvicorn_kwargs(settings: Settings) -> dict[str, Any]:
+    """Параметры Uvicorn, определяющие производительность сервера.
+
+- uvloop и httptools (входят в uvicorn[standard]) заметно быстрее
+  стандартного asyncio-loop и h11, что важно на Raspberry Pi; режим "auto"
+  выбирает их, если они установлены, а иначе (например, uvloop на Windows)
+  откатывается на asyncio и h11, и сервер всё равно запускается,
+- access-лог по умолчанию выключен: это синхронная запись на каждый запрос.
+"""
+
+    return {
+        "loop": "auto",
+        "http": "auto",
+        "access_log": settings.access_log,
+    }
+
+
 def create_app(
     settings: Settings | None = None,
     registry: DeviceRegistry | None = None,
@@ -79,25 +114,36 @@ def create_app(
     logger = logging.getLogger("nightlight")
 
     registry = registry or build_registry(settings)
-    app = FastAPI(title="Nightlight", version="0.1.0")
+    # ORJSONResponse: JSON-ответы сериализуются orjson сразу в bytes,
+    # это заметно дешевле стандартного json на Raspberry Pi.
+    app = FastAPI(
+        title="Nightlight",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
 
     # Храним зависимости в app.state, чтобы:
     # - зависимости FastAPI могли доставать их через Request,
     # - тесты могли подменять их при создании приложения.
-    app.state.settings = settings
-    app.state.registry = registry
-    app.state.scenarios = ScenarioRegistry()
-    app.state.started_at = time.time()
-
-    # Web UI лежит рядом с Python-пакетом (app/web) и раздаётся как статика.
-    root = Path(__file__).resolve().parents[1]
-    web_dir = root / "web"
-    app.mount("/static", StaticFiles(directory=str(web_dir), html=False), name="static")
-
-    app.include_router(web_router)
-    app.include_router(system_router)
-    app.include_router(led_router)
-    app.include_router(scenarios_router)
+    app.state.ctx = AppCtx(
+        settings=settings, registry=registry, scenarios=ScenarioRegistry()
+    )
+    # Токен не меняется во время работы, поэтому кодируем его один раз:
+    # на каждом запросе auth сравнивает уже готовые bytes.
+    app.state.api_token_bytes = settings.api_token_b
+    # Для uptime берём монотонные часы: они не прыгают при смене системного
+    # времени (например, после синхронизации NTP на Raspberry Pi без RTC).
+    app.state.started_at_monotonic_ns = time.monotonic_ns()
+
+    app.mount(
+        "/static", StaticFiles(directory=str(_WEB_DIR), html=False), name="static"
+    )
+
+    app.include_router(_root_router)
+
+    # Генерируем OpenAPI-схему сразу: FastAPI кэширует её в app.openapi_schema,
+    # и первый запрос к /openapi.json или /docs не платит за её построение.
+    app.openapi()
 
     @app.middleware("http")
     async def _log_errors(
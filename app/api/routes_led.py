@@ -1,14 +1,20 @@
 """API для управления LED-устройствами.
 
 Эндпоинты этого модуля — это “проводка” между HTTP и доменной моделью:
-- аутентификация проверяется зависимостью get_auth,
+- аутентификация проверяется зависимостью auth_dep,
 - доступ к устройствам идёт через доменный реестр DeviceRegistry,
 - вход/выход сериализуются Pydantic-схемами.
 
+Выходные модели создаются через model_construct(): данные приходят из домена
+(уже проверены), поэтому повторная валидация при создании не нужна.
+
 Важно:
 - команды `power` и `brightness` возвращают новое состояние устройства, чтобы
   UI/клиенту не нужно было делать дополнительный GET,
-- device_id — строковый идентификатор устройства (по умолчанию "nightlight").
+- device_id — строковый идентификатор устройства (по умолчанию "nightlight"),
+- list_devices объявлен async def (только чтение реестра), а команды и чтение
+  состояния остаются def: они обращаются к контроллеру LED и PWM-бэкенду,
+  поэтому FastAPI выполняет их в threadpool.
 """
 
 from __future__ import annotations
@@ -16,7 +22,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.auth import AuthContext
-from app.api.deps import get_auth, get_registry
+from app.api.deps import auth_dep, get_registry
 from app.api.schemas import DeviceInfoOut, LedStateOut, SetBrightnessIn, SetPowerIn
 from app.domain.devices import DeviceRegistry
 
@@ -24,14 +30,15 @@ router = APIRouter(prefix="/api/v1", tags=["devices"])
 
 
 @router.get("/devices", response_model=list[DeviceInfoOut])
-def list_devices(
+async def list_devices(
     registry: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> list[DeviceInfoOut]:
     """Вернуть список зарегистрированных устройств."""
     devices = registry.list_devices()
     return [
-        DeviceInfoOut(device_id=d.device_id, device_type=d.device_type) for d in devices
+        DeviceInfoOut.model_construct(device_id=d.device_id, device_type=d.device_type)
+        for d in devices
     ]
 
 
@@ -39,7 +46,7 @@ def list_devices(
 def get_led_state(
     device_id: str,
     registry: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> LedStateOut:
     """Вернуть текущее состояние LED-устройства."""
     try:
@@ -52,7 +59,7 @@ def get_led_state(
         ) from exc
 
     state = device.state()
-    return LedStateOut(is_on=state.is_on, brightness=state.brightness)
+    return LedStateOut.model_construct(is_on=state.is_on, brightness=state.brightness)
 
 
 @router.post("/devices/{device_id}/power", response_model=LedStateOut)
@@ -60,7 +67,7 @@ def set_led_power(
     device_id: str,
     payload: SetPowerIn,
     registry: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> LedStateOut:
     """Установить питание LED-устройства (вкл/выкл) и вернуть новое состояние."""
     try:
@@ -72,7 +79,7 @@ def set_led_power(
         ) from exc
 
     state = device.set_power(payload.is_on)
-    return LedStateOut(is_on=state.is_on, brightness=state.brightness)
+    return LedStateOut.model_construct(is_on=state.is_on, brightness=state.brightness)
 
 
 @router.post("/devices/{device_id}/brightness", response_model=LedStateOut)
@@ -80,7 +87,7 @@ def set_led_brightness(
     device_id: str,
     payload: SetBrightnessIn,
     registry: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> LedStateOut:
     """Установить яркость LED-устройства и вернуть новое состояние."""
     try:
@@ -92,5 +99,5 @@ def set_led_brightness(
         ) from exc
 
     state = device.set_brightness(payload.brightness)
-    return LedStateOut(is_on=state.is_on, brightness=state.brightness)
+    return LedStateOut.model_construct(is_on=state.is_on, brightness=state.brightness)
 
@@ -14,20 +14,39 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any, cast
+from collections.abc import Callable
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
 from app.api.auth import AuthContext
-from app.api.deps import get_auth, get_registry
-from app.domain.devices import DeviceRegistry
+from app.api.deps import AppCtx, auth_dep, get_ctx, get_scenarios
+from app.domain.devices import LedDevice
 from app.domain.scenarios import Scenario, ScenarioRegistry
+from app.gpio.base import LedState
 
 router = APIRouter(prefix="/api/v1", tags=["scenarios"])
 
 
+def _action_set_power(device: LedDevice, action: dict[str, Any]) -> LedState:
+    # set_power: включает/выключает устройство.
+    return device.set_power(bool(action.get("is_on", False)))
+
+
+def _action_set_brightness(device: LedDevice, action: dict[str, Any]) -> LedState:
+    # set_brightness: задаёт яркость 0..1.
+    return device.set_brightness(float(action.get("brightness", 0.0)))
+
+
+# Таблица поддерживаемых действий сценария: type -> обработчик.
+# Новое действие добавляется одной функцией и одной строкой здесь.
+_ACTION_HANDLERS: dict[str, Callable[[LedDevice, dict[str, Any]], LedState]] = {
+    "set_power": _action_set_power,
+    "set_brightness": _action_set_brightness,
+}
+
+
 class ScenarioOut(BaseModel):
     """Схема ответа сценария."""
     scenario_id: str
@@ -41,15 +60,10 @@ class ScenarioUpsertIn(BaseModel):
     actions: list[dict[str, Any]] = Field(default_factory=list)
 
 
-def get_scenarios(request: Request) -> ScenarioRegistry:
-    """Достать реестр сценариев из состояния приложения."""
-    return cast(ScenarioRegistry, request.app.state.scenarios)
-
-
 @router.get("/scenarios", response_model=list[ScenarioOut])
-def list_scenarios(
+async def list_scenarios(
     registry: ScenarioRegistry = Depends(get_scenarios),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> list[ScenarioOut]:
     """Вернуть список сценариев."""
     return [
@@ -63,7 +77,7 @@ def upsert_scenario(
     scenario_id: str,
     payload: ScenarioUpsertIn,
     registry: ScenarioRegistry = Depends(get_scenarios),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> ScenarioOut:
     """Создать или обновить сценарий."""
     scenario = Scenario(
@@ -82,9 +96,8 @@ def upsert_scenario(
 @router.post("/scenarios/{scenario_id}/trigger")
 def trigger_scenario(
     scenario_id: str,
-    scenarios: ScenarioRegistry = Depends(get_scenarios),
-    devices: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    ctx: AppCtx = Depends(get_ctx),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> dict[str, Any]:
     """Запустить сценарий и вернуть список реально выполненных действий.
 
@@ -94,34 +107,33 @@ def trigger_scenario(
 чтобы клиент мог постепенно усложнять сценарии, не ломая весь запуск.
 """
     try:
-        scenario = scenarios.get(scenario_id)
+        scenario = ctx.scenarios.get(scenario_id)
     except KeyError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found",
         ) from exc
 
-    executed: list[dict[str, Any]] = []
+    # Первый проход: отбрасываем некорректные действия и находим обработчики.
+    # Действия — это словари, чтобы формат можно было менять без миграций.
+    planned: list[tuple[str, str, dict[str, Any]]] = []
     for action in scenario.actions:
-        # Действия — это словари, чтобы формат можно было менять без миграций.
-        action_dict = action
-        action_type = str(action_dict.get("type", "")).strip()
-        device_id = str(action_dict.get("device_id", "")).strip()
-        if not device_id:
+        action_type = str(action.get("type", "")).strip()
+        device_id = str(action.get("device_id", "")).strip()
+        if not device_id or action_type not in _ACTION_HANDLERS:
             continue
-        if action_type == "set_power":
-            # set_power: включает/выключает устройство.
-            is_on = bool(action_dict.get("is_on", False))
-            state = devices.get_led(device_id).set_power(is_on)
-            executed.append(
-                {"type": action_type, "device_id": device_id, "state": asdict(state)}
-            )
-        elif action_type == "set_brightness":
-            # set_brightness: задаёт яркость 0..1.
-            brightness = float(action_dict.get("brightness", 0.0))
-            state = devices.get_led(device_id).set_brightness(brightness)
-            executed.append(
-                {"type": action_type, "device_id": device_id, "state": asdict(state)}
-            )
+        planned.append((action_type, device_id, action))
+
+    # Каждое устройство достаём из реестра один раз, даже если сценарий
+    # обращается к нему многократно.
+    devices = ctx.registry
+    targets = {device_id: devices.get_led(device_id) for _, device_id, _ in planned}
+
+    executed: list[dict[str, Any]] = []
+    for action_type, device_id, action in planned:
+        state = _ACTION_HANDLERS[action_type](targets[device_id], action)
+        executed.append(
+            {"type": action_type, "device_id": device_id, "state": state.to_dict()}
+        )
 
     return {"scenario_id": scenario.scenario_id, "executed": executed}
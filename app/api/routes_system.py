@@ -8,6 +8,9 @@
 Зачем разделять /health и /status:
 - /health должен быть максимально простым и быстрым,
 - /status может делать больше работы и требовать токен.
+
+Все ручки здесь async def: они не трогают PWM-бэкенд (только читают
+состояние), поэтому выполняются прямо в event loop, без threadpool.
 """
 
 from __future__ import annotations
@@ -17,16 +20,23 @@ import time
 from fastapi import APIRouter, Depends, Request, Response
 
 from app.api.auth import AuthContext
-from app.api.deps import get_auth, get_registry, get_settings
+from app.api.deps import AppCtx, auth_dep, get_ctx, get_registry
 from app.api.schemas import DeviceInfoOut, LedStateOut, StatusOut
-from app.config import Settings
 from app.domain.devices import DeviceRegistry
 
 router = APIRouter(tags=["system"])
 
+# Неизменные куски строк метрик заранее закодированы в bytes: на каждом scrape
+# тело собирается в bytearray без промежуточных str.
+_METRIC_LED_ON = b'nightlight_led_on{device_id="'
+_METRIC_LED_BRIGHTNESS = b'nightlight_led_brightness{device_id="'
+_METRIC_LABEL_END = b'"} '
+_METRIC_ON_VALUES = (b"0\n", b"1\n")
+_METRICS_MEDIA_TYPE = "text/plain; version=0.0.4"
+
 
 @router.get("/health")
-def health() -> dict[str, str]:
+async def health() -> dict[str, str]:
     """Проверка “сервис жив”.
 
 Эндпоинт не требует токена, чтобы его можно было использовать для простых
@@ -36,11 +46,10 @@ def health() -> dict[str, str]:
 
 
 @router.get("/status", response_model=StatusOut)
-def status_endpoint(
+async def status_endpoint(
     request: Request,
-    settings: Settings = Depends(get_settings),
-    registry: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    ctx: AppCtx = Depends(get_ctx),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> StatusOut:
     """Диагностический статус сервиса.
 
@@ -50,36 +59,37 @@ def status_endpoint(
 - список устройств,
 - состояния LED-устройств.
 """
-    now = time.time()
-    started_at = float(getattr(request.app.state, "started_at", now))
-    uptime = now - started_at
-
-    # Получаем список устройств из доменного реестра и дополняем состояниями.
-    devices = registry.list_devices()
-    led_states: dict[str, LedStateOut] = {}
-    for device in devices:
-        if device.device_type != "led":
-            continue
-        state = registry.get_led(device.device_id).state()
-        led_states[device.device_id] = LedStateOut(
-            is_on=state.is_on, brightness=state.brightness
-        )
-    return StatusOut(
+    # started_at_monotonic_ns всегда выставляется в create_app().
+    started_ns: int = request.app.state.started_at_monotonic_ns
+    uptime = (time.monotonic_ns() - started_ns) / 1e9
+
+    # Берём устройства и их состояния из доменного реестра одним снимком.
+    snapshot = ctx.registry.snapshot_leds()
+    # Данные пришли из домена и уже корректны, поэтому model_construct()
+    # собирает модели без повторной валидации.
+    return StatusOut.model_construct(
         service="nightlight",
         uptime_s=uptime,
-        gpio_backend=settings.gpio_backend,
+        gpio_backend=ctx.settings.gpio_backend,
         devices=[
-            DeviceInfoOut(device_id=d.device_id, device_type=d.device_type)
-            for d in devices
+            DeviceInfoOut.model_construct(
+                device_id=info.device_id, device_type=info.device_type
+            )
+            for info, _ in snapshot
         ],
-        led_states=led_states,
+        led_states={
+            info.device_id: LedStateOut.model_construct(
+                is_on=state.is_on, brightness=state.brightness
+            )
+            for info, state in snapshot
+        },
     )
 
 
 @router.get("/metrics", include_in_schema=False)
-def metrics(
+async def metrics(
     registry: DeviceRegistry = Depends(get_registry),
-    _auth: AuthContext = Depends(get_auth),
+    _auth: AuthContext = Depends(auth_dep),
 ) -> Response:
     """Метрики в текстовом формате Prometheus.
 
@@ -87,19 +97,17 @@ def metrics(
 - nightlight_led_on{device_id="..."} 0|1
 - nightlight_led_brightness{device_id="..."} 0.000000..1.000000
 """
-    lines: list[str] = []
-    for device in registry.list_devices():
-        if device.device_type != "led":
-            continue
-        state = registry.get_led(device.device_id).state()
-        lines.append(
-            f'nightlight_led_on{{device_id="{device.device_id}"}} '
-            f"{1 if state.is_on else 0}"
-        )
-        lines.append(
-            f'nightlight_led_brightness{{device_id="{device.device_id}"}} '
-            f"{state.brightness:.6f}"
-        )
-    body = "\n".join(lines) + ("\n" if lines else "")
-    return Response(content=body, media_type="text/plain; version=0.0.4")
+    buf = bytearray()
+    for info, state in registry.snapshot_leds():
+        device_id = info.device_id.encode("utf-8")
+        buf += _METRIC_LED_ON
+        buf += device_id
+        buf += _METRIC_LABEL_END
+        buf += _METRIC_ON_VALUES[state.is_on]
+        buf += _METRIC_LED_BRIGHTNESS
+        buf += device_id
+        buf += _METRIC_LABEL_END
+        buf += b"%.6f\n" % state.brightness
+    # Отдаём bytes, чтобы Starlette не перекодировала строку сама.
+    return Response(content=bytes(buf), media_type=_METRICS_MEDIA_TYPE)
 
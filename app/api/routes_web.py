@@ -19,10 +19,12 @@ from fastapi.responses import FileResponse
 
 router = APIRouter(tags=["web"])
 
+# Путь к index.html вычисляем один раз при импорте: Path.resolve() делает
+# системные вызовы, и повторять их на каждый GET / незачем.
+_INDEX_HTML = Path(__file__).resolve().parents[1] / "web" / "index.html"
+
 
 @router.get("/", include_in_schema=False)
-def index() -> FileResponse:
+async def index() -> FileResponse:
     """Отдать главную HTML-страницу веб-интерфейса."""
-    root = Path(__file__).resolve().parents[1]
-    web_dir = root / "web"
-    return FileResponse(web_dir / "index.html")
+    return FileResponse(_INDEX_HTML)
@@ -70,7 +70,7 @@ class StatusOut(BaseModel):
 
 Это не "healthcheck" (он проще), а диагностический endpoint:
 - uptime,
-- какой GPIO-бэкенд активен (mock/rpi),
+- какой GPIO-бэкенд активен (mock/rpi/pigpio),
 - какие устройства зарегистрированы,
 - их текущие состояния.
 """
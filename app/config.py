@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,14 +34,26 @@ class Settings(BaseSettings):
         ),
     )
 
-    gpio_backend: str = Field(default="mock", description="'mock' или 'rpi'")
+    gpio_backend: str = Field(default="mock", description="'mock', 'rpi' или 'pigpio'")
     led_gpio_pin: int = Field(default=18, ge=0)
     pwm_frequency_hz: int = Field(default=800, ge=1)
+    mock_single_thread: bool = Field(
+        default=False,
+        description=(
+            "Отключить lock в mock-бэкенде (только для однопоточных тестов)."
+        ),
+    )
 
     ssl_certfile: str | None = Field(default=None)
     ssl_keyfile: str | None = Field(default=None)
 
     log_level: str = Field(default="INFO")
+    access_log: bool = Field(
+        default=False,
+        description=(
+            "Включить access-лог Uvicorn (синхронная запись на каждый запрос)."
+        ),
+    )
 
     telegram_bot_token: str | None = Field(default=None)
     telegram_allowed_chat_ids: str = Field(
@@ -59,6 +73,13 @@ class Settings(BaseSettings):
 
     device_id: str = Field(default="nightlight")
 
+    @cached_property
+    def api_token_b(self) -> bytes:
+        """Токен API в виде bytes (кодируется один раз на объект настроек)."""
+
+        # compare_digest быстрее и проще всего сравнивает именно bytes.
+        return self.api_token.encode("utf-8")
+
     def allowed_chat_ids(self) -> set[int]:
         """Разобрать список разрешённых идентификаторов чата из настроек."""
 
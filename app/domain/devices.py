@@ -64,44 +64,80 @@ class LedDevice:
 
 
 class DeviceRegistry:
-    """Потокобезопасный реестр устройств в памяти."""
+    """Потокобезопасный реестр устройств в памяти.
+
+Устройства регистрируются при старте, а читаются на каждом запросе, поэтому
+реестр публикует словарь “подменой”:
+- запись (register_led/close) под lock собирает новый dict и присваивает его,
+- чтение берёт текущую ссылку в локальную переменную и работает без lock.
+Опубликованный dict больше никогда не меняется.
+"""
 
     def __init__(self) -> None:
-        self._lock = Lock()
+        # Lock сериализует только запись: читатели его не берут.
+        self._write_lock = Lock()
         self._led_devices: dict[str, LedDevice] = {}
+        # Быстрый путь для типичного случая “одно устройство” (см. build_registry):
+        # пара (device_id, device) читается без lock одной атомарной загрузкой
+        # атрибута. Храним именно кортеж, чтобы id и устройство не “разъехались”.
+        self._single: tuple[str, LedDevice] | None = None
 
     def register_led(self, device: LedDevice) -> None:
         """Зарегистрировать LED-устройство."""
 
         # Регистрируем по device_id — это ключ для API и сценариев.
-        with self._lock:
-            self._led_devices[device.device_id] = device
+        with self._write_lock:
+            devices = dict(self._led_devices)
+            devices[device.device_id] = device
+            self._publish(devices)
 
     def list_devices(self) -> list[DeviceInfo]:
         """Вернуть список всех зарегистрированных устройств."""
 
-        with self._lock:
-            return [d.info() for d in self._led_devices.values()]
+        devices = self._led_devices
+        return [d.info() for d in devices.values()]
+
+    def snapshot_leds(self) -> list[tuple[DeviceInfo, LedState]]:
+        """Вернуть метаданные и состояние всех LED-устройств за один проход.
+
+Нужен для /status и /metrics: вместо list_devices() + get_led() на каждое
+устройство реестр обходит один и тот же опубликованный dict.
+"""
+
+        devices = self._led_devices
+        return [(d.info(), d.state()) for d in devices.values()]
 
     def get_led(self, device_id: str) -> LedDevice:
         """Получить устройство по идентификатору."""
 
-        with self._lock:
-            device = self._led_devices.get(device_id)
-            if device is None:
-                # В домене используем KeyError — транспортный слой решает,
-                # как преобразовать это в HTTP-ошибку.
-                raise KeyError(device_id)
-            return device
+        single = self._single
+        if single is not None and single[0] == device_id:
+            return single[1]
+
+        device = self._led_devices.get(device_id)
+        if device is None:
+            # В домене используем KeyError — транспортный слой решает,
+            # как преобразовать это в HTTP-ошибку.
+            raise KeyError(device_id)
+        return device
 
     def close(self) -> None:
         """Закрыть все устройства."""
 
-        with self._lock:
+        with self._write_lock:
             devices = list(self._led_devices.values())
-            self._led_devices.clear()
+            self._publish({})
 
         # Закрываем устройства вне lock, чтобы не держать блокировку
         # на долгих операциях.
         for device in devices:
             device.close()
+
+    def _publish(self, devices: dict[str, LedDevice]) -> None:
+        # Вызывается под self._write_lock. После публикации dict не меняется.
+        if len(devices) == 1:
+            (device,) = devices.values()
+            self._single = (device.device_id, device)
+        else:
+            self._single = None
+        self._led_devices = devices
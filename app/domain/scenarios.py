@@ -36,33 +36,38 @@ scenario_id:
 
 
 class ScenarioRegistry:
-    """Реестр сценариев в памяти."""
+    """Реестр сценариев в памяти.
+
+Сценарии читаются часто, а меняются редко, поэтому используется copy-on-write:
+- запись собирает новый dict и подменяет ссылку одним присваиванием,
+- чтение берёт текущую ссылку и работает с ней без блокировки.
+Lock остаётся только у записи, чтобы параллельные upsert не теряли друг друга.
+"""
 
     def __init__(self) -> None:
-        self._lock = Lock()
+        self._write_lock = Lock()
         self._scenarios: dict[str, Scenario] = {}
 
     def list(self) -> list[Scenario]:
         """Вернуть список сценариев."""
 
-        # Возвращаем копию списка, чтобы внешние вызовы не держали блокировку.
-        with self._lock:
-            return list(self._scenarios.values())
+        # Опубликованный dict никогда не меняется, поэтому копия списка
+        # снимается без блокировки.
+        return list(self._scenarios.values())
 
     def upsert(self, scenario: Scenario) -> None:
         """Создать или обновить сценарий."""
 
         # Upsert упрощает API: один endpoint и для создания, и для обновления.
-        with self._lock:
-            self._scenarios[scenario.scenario_id] = scenario
+        with self._write_lock:
+            self._scenarios = {**self._scenarios, scenario.scenario_id: scenario}
 
     def get(self, scenario_id: str) -> Scenario:
         """Получить сценарий."""
 
-        with self._lock:
-            scenario = self._scenarios.get(scenario_id)
-            if scenario is None:
-                # Домен возвращает KeyError, транспортный слой сам решит, что это 404.
-                raise KeyError(scenario_id)
-            return scenario
+        scenario = self._scenarios.get(scenario_id)
+        if scenario is None:
+            # Домен возвращает KeyError, транспортный слой сам решит, что это 404.
+            raise KeyError(scenario_id)
+        return scenario
 
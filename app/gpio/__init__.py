@@ -2,9 +2,11 @@
 
 Этот пакет содержит всё, что связано с управлением “железом”:
 - base.py: интерфейсы (Protocol) и базовые типы состояния,
-- factory.py: выбор конкретного бэкенда по строке ("mock"/"rpi"),
+- factory.py: выбор конкретного бэкенда по строке ("mock"/"rpi"/"pigpio"),
 - mock_gpio.py: реализация для разработки/CI без Raspberry Pi,
 - rpi_gpio.py: реализация через RPi.GPIO для настоящего устройства,
+- pigpio_gpio.py: аппаратный PWM через pigpio (меньше нагрузка на CPU),
+- locks.py: выбор lock (FastRLock при GIL, threading.RLock без GIL),
 - led.py: контроллер логики яркости/включения, работающий поверх PwmOutput.
 
 Важно: домен и API работают не с RPi.GPIO напрямую, а через абстракции,
@@ -25,9 +25,14 @@ class PwmOutput(Protocol):
 - start: первичный запуск,
 - change_duty_cycle: обновление скважности,
 - stop: остановка,
+- apply: всё сразу — запуск, изменение или остановка одним вызовом,
 - close: освобождение ресурсов/cleanup.
 """
 
+    # Пустые __slots__ нужны, чтобы у наследников со своими __slots__
+    # (бэкенды) не появлялся __dict__ из базового класса.
+    __slots__ = ()
+
     def start(self, duty_cycle_percent: float) -> None:
         """Запустить PWM с заданной скважностью (0..100).
 
@@ -44,6 +49,14 @@ class PwmOutput(Protocol):
         """Остановить PWM-выход.
 
 После stop() ожидается, что устройство физически “погаснет”.
+"""
+
+    def apply(self, duty_cycle_percent: float) -> None:
+        """Выставить скважность (0..100) одним вызовом.
+
+Запускает PWM, если он ещё не запущен, и останавливает при duty <= 0.
+Это основной путь LedController: одно решение и один lock на обновление
+вместо выбора между stop/start/change_duty_cycle на двух уровнях.
 """
 
     def close(self) -> None:
@@ -63,3 +76,12 @@ brightness — всегда нормализована в диапазоне 0..
 
     is_on: bool
     brightness: float
+
+    def to_dict(self) -> dict[str, bool | float]:
+        """Вернуть состояние как обычный dict (для JSON-ответов API).
+
+Поля перечислены явно: это заметно дешевле dataclasses.asdict(), который
+обходит поля через рефлексию и делает глубокое копирование.
+"""
+
+        return {"is_on": self.is_on, "brightness": self.brightness}
@@ -1,34 +1,74 @@
 """Фабрика GPIO-бэкендов.
 
-Задача модуля — по строковому имени бэкенда (“mock”, “rpi”) вернуть объект,
+Задача модуля — по строковому имени бэкенда (“mock”, “rpi”, “pigpio”) вернуть объект,
 который реализует контракт PwmOutput.
 
 Такой уровень абстракции нужен, чтобы остальной код не знал:
 - как именно создаётся PWM,
 - какие импорты нужны для реального железа,
 - где находится mock-реализация.
+
+Бэкенды перечислены в таблице _BACKENDS (имя -> конструктор): выбор
+бэкенда — один поиск в dict, а новый бэкенд добавляется одной строкой.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from .base import PwmOutput
 from .mock_gpio import MockPwmOutput
 
+_BackendFactory = Callable[..., PwmOutput]
 
-def create_pwm_output(backend: str, *, pin: int, frequency_hz: int) -> PwmOutput:
-    """Создать PWM-выход для выбранного бэкенда."""
 
-    # Нормализуем строку, чтобы значения из env были более “прощающе” обработаны.
-    backend_norm = backend.strip().lower()
-    if backend_norm == "mock":
-        # Mock не требует pin, поэтому он игнорируется.
-        return MockPwmOutput(frequency_hz=frequency_hz)
-    if backend_norm == "rpi":
-        # Импортируем здесь, чтобы на не-RPi окружениях модуль не падал при импорте.
-        from .rpi_gpio import RpiPwmOutput
+def _create_mock(*, pin: int, frequency_hz: int, thread_safe: bool) -> PwmOutput:
+    # Mock не требует pin, поэтому он игнорируется.
+    return MockPwmOutput(frequency_hz=frequency_hz, thread_safe=thread_safe)
+
+
+def _create_rpi(*, pin: int, frequency_hz: int, thread_safe: bool) -> PwmOutput:
+    # Импортируем здесь, чтобы на не-RPi окружениях модуль не падал при импорте.
+    # Повторные вызовы берут модуль из sys.modules.
+    from .rpi_gpio import RpiPwmOutput
+
+    # Реальное железо всегда защищено lock, thread_safe здесь не используется.
+    return RpiPwmOutput(pin=pin, frequency_hz=frequency_hz)
+
+
+def _create_pigpio(*, pin: int, frequency_hz: int, thread_safe: bool) -> PwmOutput:
+    # Ленивый импорт по той же причине, что и для rpi.
+    from .pigpio_gpio import PigpioPwmOutput
 
-        return RpiPwmOutput(pin=pin, frequency_hz=frequency_hz)
+    return PigpioPwmOutput(pin=pin, frequency_hz=frequency_hz)
 
-    # Если бэкенд неизвестен — это ошибка конфигурации, пусть сервис упадёт при старте.
-    raise ValueError(f"Unsupported GPIO backend: {backend}")
 
+_BACKENDS: dict[str, _BackendFactory] = {
+    "mock": _create_mock,
+    "rpi": _create_rpi,
+    "pigpio": _create_pigpio,
+}
+
+
+def create_pwm_output(
+    backend: str,
+    *,
+    pin: int,
+    frequency_hz: int,
+    thread_safe: bool = True,
+) -> PwmOutput:
+    """Создать PWM-выход для выбранного бэкенда.
+
+thread_safe=False отключает lock только у mock-бэкенда (для однопоточных
+тестов). Реальное железо всегда защищено lock.
+"""
+
+    # Нормализуем строку, чтобы значения из env были более “прощающе” обработаны.
+    try:
+        factory = _BACKENDS[backend.strip().lower()]
+    except KeyError:
+        # Если бэкенд неизвестен — это ошибка конфигурации,
+        # пусть сервис упадёт при старте.
+        raise ValueError(f"Unsupported GPIO backend: {backend}") from None
+
+    return factory(pin=pin, frequency_hz=frequency_hz, thread_safe=thread_safe)
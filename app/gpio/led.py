@@ -3,6 +3,9 @@
 Здесь находится простая бизнес-логика управления яркостью:
 - яркость хранится как float 0..1,
 - физическая “скважность” PWM вычисляется как brightness * 100,
+- под lock выполняется только команда PWM (pwm.apply) и смена состояния,
+- чтение состояния (state()) lock не берёт,
+- повтор команды с тем же состоянием не дёргает PWM-бэкенд,
 - выключение приводит к остановке PWM и сбросу яркости в 0.
 
 Почему отдельный контроллер:
@@ -13,75 +16,99 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from threading import Lock
-
 from .base import LedState, PwmOutput
+from .locks import new_lock
 
+# Яркости, отличающиеся меньше чем на эту величину, считаются одинаковыми:
+# повторная команда с тем же значением не должна снова дёргать PWM.
+_BRIGHTNESS_EPSILON = 1e-6
 
-def _clamp(value: float, low: float, high: float) -> float:
-    """Ограничить значение диапазоном [low, high]."""
-    if value < low:
-        return low
-    if value > high:
-        return high
-    return value
+# Снимок выключенного состояния один на все вызовы set_power(False).
+_OFF_SNAPSHOT: tuple[bool, float] = (False, 0.0)
 
 
-@dataclass(slots=True)
 class LedController:
     """Контроллер LED с поддержкой включения и яркости."""
 
-    pwm: PwmOutput
-    _lock: Lock = field(init=False, repr=False)
-    _is_on: bool = field(init=False, default=False)
-    _brightness: float = field(init=False, default=0.0)
-
-    def __post_init__(self) -> None:
+    __slots__ = ("pwm", "_lock", "_snapshot")
+
+    def __init__(self, pwm: PwmOutput) -> None:
+        self.pwm = pwm
+        # Состояние хранится одним неизменяемым кортежем (is_on, brightness):
+        # писатели подменяют ссылку целиком, а читатель берёт её без lock и
+        # никогда не увидит “половину” обновления.
+        #
+        # Порядок публикации: новый кортеж полностью собирается до записи,
+        # а запись self._snapshot = new_snapshot — последняя операция под lock,
+        # после вызова PWM. Запись/чтение ссылки на атрибут атомарны и на
+        # free-threaded сборках (PEP 703), поэтому читатель видит либо старый,
+        # либо новый кортеж целиком. Взаимное исключение писателей (и порядок
+        # команд PWM) даёт lock из new_lock(): без GIL это threading.RLock,
+        # потому что FastRLock корректен только при включённом GIL.
+        self._snapshot: tuple[bool, float] = _OFF_SNAPSHOT
         # Lock нужен, потому что API может дергаться параллельно.
-        self._lock = Lock()
+        self._lock = new_lock()
+
+    def __repr__(self) -> str:
+        return f"LedController(pwm={self.pwm!r})"
 
     def state(self) -> LedState:
         """Вернуть текущее состояние."""
 
-        with self._lock:
-            return LedState(is_on=self._is_on, brightness=self._brightness)
+        is_on, brightness = self._snapshot
+        return LedState(is_on=is_on, brightness=brightness)
 
     def set_power(self, is_on: bool) -> LedState:
         """Включить или выключить LED."""
 
+        if not is_on:
+            # Выключение: останавливаем PWM и сбрасываем значение яркости.
+            with self._lock:
+                self.pwm.apply(0.0)
+                self._snapshot = _OFF_SNAPSHOT
+            return LedState(is_on=False, brightness=0.0)
+
+        is_on_now, current = self._snapshot
+        if is_on_now:
+            # Уже включено с ненулевой яркостью — PWM трогать незачем.
+            return LedState(is_on=True, brightness=current)
+
         with self._lock:
-            if is_on:
-                # При первом включении выставляем яркость в максимум,
-                # чтобы “включить” выглядело ожидаемо.
-                if self._brightness <= 0.0:
-                    self._brightness = 1.0
-                self._apply()
-                self._is_on = True
-            else:
-                # Выключение: останавливаем PWM и сбрасываем значение яркости.
-                self.pwm.stop()
-                self._is_on = False
-                self._brightness = 0.0
-            return LedState(is_on=self._is_on, brightness=self._brightness)
+            # При первом включении выставляем яркость в максимум,
+            # чтобы “включить” выглядело ожидаемо.
+            current = self._snapshot[1]
+            b = current if current > 0.0 else 1.0
+            new_snapshot = (True, b)
+            self.pwm.apply(b * 100.0)
+            self._snapshot = new_snapshot
+        return LedState(is_on=True, brightness=b)
 
     def set_brightness(self, brightness: float) -> LedState:
         """Установить яркость в диапазоне 0..1."""
 
+        # Приводим к float и “срезаем” диапазон, чтобы избежать
+        # некорректных значений. Это не требует lock. Тернарный оператор
+        # дешевле отдельной функции и min()/max(): нет вызова вообще.
+        b = float(brightness)
+        b = 0.0 if b <= 0.0 else 1.0 if b >= 1.0 else b
+        if b == 0.0:
+            # Нулевая яркость трактуется как выключение.
+            return self.set_power(False)
+
+        is_on_now, current = self._snapshot
+        if is_on_now and abs(b - current) < _BRIGHTNESS_EPSILON:
+            # Та же яркость (например, повтор из UI) — PWM трогать незачем.
+            return LedState(is_on=True, brightness=current)
+
+        # Под lock остаются только вызов PWM и смена состояния: порядок
+        # команд в железе должен совпадать с порядком смены состояния,
+        # иначе при гонке двух запросов LED и state() разойдутся.
+        # Ненулевая яркость => устройство включено.
+        new_snapshot = (True, b)
         with self._lock:
-            # Приводим к float и “срезаем” диапазон, чтобы избежать
-            # некорректных значений.
-            self._brightness = _clamp(float(brightness), 0.0, 1.0)
-            if self._brightness == 0.0:
-                # Нулевая яркость трактуется как выключение.
-                self.pwm.stop()
-                self._is_on = False
-                return LedState(is_on=False, brightness=0.0)
-
-            # Ненулевая яркость => устройство включено.
-            self._is_on = True
-            self._apply()
-            return LedState(is_on=True, brightness=self._brightness)
+            self.pwm.apply(b * 100.0)
+            self._snapshot = new_snapshot
+        return LedState(is_on=True, brightness=b)
 
     def close(self) -> None:
         """Освободить ресурсы."""
@@ -91,8 +118,3 @@ class LedController:
                 self.pwm.stop()
             finally:
                 self.pwm.close()
-
-    def _apply(self) -> None:
-        # Переводим нормализованную яркость в PWM-скважность.
-        duty = self._brightness * 100.0
-        self.pwm.change_duty_cycle(duty)
@@ -0,0 +1,28 @@
+"""Выбор lock для GPIO-кода.
+
+По умолчанию используется FastRLock: он реализован на C и без конкуренции
+дешевле threading.RLock, а именно так lock здесь используется почти всегда.
+
+Но корректность FastRLock опирается на GIL. На free-threaded сборках
+(PEP 703, PYTHON_GIL=0) он не даёт взаимного исключения, поэтому там
+используется обычный threading.RLock — тоже реентерабельный, с той же
+семантикой для вызывающего кода.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from contextlib import AbstractContextManager
+from typing import Any, Final
+
+from fastrlock.rlock import FastRLock
+
+# До 3.13 sys._is_gil_enabled нет — там GIL включён всегда.
+GIL_ENABLED: Final[bool] = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def new_lock() -> AbstractContextManager[Any]:
+    """Создать реентерабельный lock, корректный для текущего интерпретатора."""
+
+    return FastRLock() if GIL_ENABLED else threading.RLock()
@@ -8,34 +8,60 @@
 Зачем lock:
 - тесты/сервер могут вызывать методы параллельно,
 - мы хотим, чтобы состояние менялось атомарно.
+
+Однопоточным тестам lock не нужен: с thread_safe=False вместо него
+используется пустой контекст-менеджер (contextlib.nullcontext).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from threading import Lock
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
 
 from .base import PwmOutput
+from .locks import new_lock
 
 
-@dataclass(slots=True)
 class MockPwmOutput(PwmOutput):
     """Реализация PWM-выхода в памяти.
 
 Достаточно простая модель:
 - start() помечает started=True и сохраняет текущую скважность,
 - change_duty_cycle() также “включает” PWM при первом вызове,
-- stop() сбрасывает в 0.
+- stop() сбрасывает в 0,
+- apply() делает то же, что change_duty_cycle()/stop(), под одним lock.
 """
 
-    frequency_hz: int
-    duty_cycle_percent: float = 0.0
-    started: bool = False
-    _lock: Lock = field(init=False, repr=False)
+    __slots__ = (
+        "frequency_hz",
+        "duty_cycle_percent",
+        "started",
+        "thread_safe",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        frequency_hz: int,
+        duty_cycle_percent: float = 0.0,
+        started: bool = False,
+        thread_safe: bool = True,
+    ) -> None:
+        self.frequency_hz = frequency_hz
+        self.duty_cycle_percent = duty_cycle_percent
+        self.started = started
+        self.thread_safe = thread_safe
+        self._lock: AbstractContextManager[Any] = (
+            new_lock() if thread_safe else nullcontext()
+        )
 
-    def __post_init__(self) -> None:
-        # Lock создаём в __post_init__, чтобы не попадал в __init__-сигнатуру dataclass.
-        self._lock = Lock()
+    def __repr__(self) -> str:
+        # Нужен только для отладки: показывает “состояние пина” мок-бэкенда.
+        return (
+            f"MockPwmOutput(frequency_hz={self.frequency_hz}, "
+            f"duty_cycle_percent={self.duty_cycle_percent}, "
+            f"started={self.started}, thread_safe={self.thread_safe})"
+        )
 
     def start(self, duty_cycle_percent: float) -> None:
         with self._lock:
@@ -46,15 +72,24 @@ class MockPwmOutput(PwmOutput):
         with self._lock:
             # На реальных PWM часто нельзя “менять” до start(), поэтому в мок-бэкенде
             # делаем поведение более удобным: change_duty_cycle автоматически запускает.
-            if not self.started:
-                self.started = True
-            self.duty_cycle_percent = float(duty_cycle_percent)
+            # Присваивание без проверки дешевле ветвления и даёт тот же результат.
+            self.started = True
+            self.duty_cycle_percent = duty_cycle_percent
 
     def stop(self) -> None:
         with self._lock:
             self.started = False
             self.duty_cycle_percent = 0.0
 
+    def apply(self, duty_cycle_percent: float) -> None:
+        with self._lock:
+            if duty_cycle_percent <= 0.0:
+                self.started = False
+                self.duty_cycle_percent = 0.0
+            else:
+                self.started = True
+                self.duty_cycle_percent = duty_cycle_percent
+
     def close(self) -> None:
         # У мок-бэкенда нет реальных ресурсов.
         return
@@ -0,0 +1,112 @@
+"""GPIO-бэкенд Raspberry Pi через pigpio (аппаратный PWM).
+
+Этот модуль импортируется только при NIGHTLIGHT_GPIO_BACKEND=pigpio.
+
+Чем отличается от rpi-бэкенда:
+- RPi.GPIO делает PWM программно (отдельный Python-поток дёргает пин),
+  что грузит CPU и даёт мерцание под нагрузкой,
+- pigpio программирует аппаратный PWM-блок SoC: после установки duty cycle
+  CPU не участвует, а изменение яркости — один запрос к демону pigpiod.
+
+Примечание по PWM:
+- используется BCM-нумерация пинов,
+- аппаратный PWM доступен только на GPIO 12, 13, 18 и 19,
+- нужен запущенный демон pigpiod (модуль pigpio — лишь клиент к нему),
+- duty_cycle на входе — проценты 0..100 (как у остальных бэкендов),
+  pigpio ожидает 0..1_000_000, поэтому значение умножается на 10_000.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import PwmOutput
+from .locks import new_lock
+
+# Множитель перевода процентов (0..100) в шкалу hardware_PWM (0..1_000_000).
+_PERCENT_TO_PIGPIO_DUTY = 10_000
+
+
+class PigpioImportError(RuntimeError):
+    """Выбрасывается, если модуль pigpio недоступен или демон не запущен."""
+
+
+class PigpioPwmOutput(PwmOutput):
+    """PWM-выход на базе аппаратного PWM pigpio.
+
+Класс инкапсулирует:
+- подключение к демону pigpiod,
+- установку частоты и duty cycle через hardware_PWM,
+- безопасный доступ из разных потоков через lock.
+"""
+
+    __slots__ = ("pin", "frequency_hz", "_lock", "_pi", "_started")
+
+    def __init__(self, pin: int, frequency_hz: int) -> None:
+        self.pin = pin
+        self.frequency_hz = frequency_hz
+        self._started = False
+        # Соединение с pigpiod одно на объект, запросы к нему сериализуем.
+        self._lock = new_lock()
+        try:
+            import pigpio  # type: ignore[import-not-found]
+        except Exception as exc:  # noqa: BLE001
+            raise PigpioImportError(
+                "pigpio недоступен. Установите его на Raspberry Pi "
+                "или используйте mock-бэкенд."
+            ) from exc
+
+        self._pi: Any = pigpio.pi()
+        if not self._pi.connected:
+            raise PigpioImportError(
+                "Не удалось подключиться к демону pigpiod. "
+                "Запустите его (sudo pigpiod) или используйте rpi-бэкенд."
+            )
+
+    def __repr__(self) -> str:
+        return f"PigpioPwmOutput(pin={self.pin}, frequency_hz={self.frequency_hz})"
+
+    def start(self, duty_cycle_percent: float) -> None:
+        with self._lock:
+            self._pi.hardware_PWM(
+                self.pin,
+                self.frequency_hz,
+                int(duty_cycle_percent * _PERCENT_TO_PIGPIO_DUTY),
+            )
+            self._started = True
+
+    def change_duty_cycle(self, duty_cycle_percent: float) -> None:
+        # Для аппаратного PWM start и change — одна и та же операция:
+        # hardware_PWM просто перепрограммирует частоту и duty cycle.
+        self.start(duty_cycle_percent)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._started:
+                # Частота 0 выключает аппаратный PWM на пине.
+                self._pi.hardware_PWM(self.pin, 0, 0)
+            self._started = False
+
+    def apply(self, duty_cycle_percent: float) -> None:
+        with self._lock:
+            if duty_cycle_percent <= 0.0:
+                if self._started:
+                    self._pi.hardware_PWM(self.pin, 0, 0)
+                self._started = False
+            else:
+                self._pi.hardware_PWM(
+                    self.pin,
+                    self.frequency_hz,
+                    int(duty_cycle_percent * _PERCENT_TO_PIGPIO_DUTY),
+                )
+                self._started = True
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                if self._started:
+                    self._pi.hardware_PWM(self.pin, 0, 0)
+                self._started = False
+            finally:
+                # Закрываем соединение с pigpiod; сам демон продолжает работать.
+                self._pi.stop()
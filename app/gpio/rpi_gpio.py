@@ -14,18 +14,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from threading import Lock
 from typing import Any
 
 from .base import PwmOutput
+from .locks import new_lock
 
 
 class RpiGpioImportError(RuntimeError):
     """Выбрасывается, если модуль RPi.GPIO недоступен."""
 
 
-@dataclass(slots=True)
 class RpiPwmOutput(PwmOutput):
     """PWM-выход на базе RPi.GPIO PWM.
 
@@ -35,17 +33,15 @@ class RpiPwmOutput(PwmOutput):
 - безопасный доступ из разных потоков через lock.
 """
 
-    pin: int
-    frequency_hz: int
-    _lock: Lock = field(init=False, repr=False)
-    _gpio: Any = field(init=False, repr=False)
-    _pwm: Any = field(init=False, repr=False)
-    _started: bool = field(init=False, default=False, repr=False)
+    __slots__ = ("pin", "frequency_hz", "_lock", "_gpio", "_pwm", "_started")
 
-    def __post_init__(self) -> None:
+    def __init__(self, pin: int, frequency_hz: int) -> None:
+        self.pin = pin
+        self.frequency_hz = frequency_hz
+        self._started = False
         # Защищаем операции над GPIO, потому что FastAPI может обрабатывать
         # запросы параллельно.
-        self._lock = Lock()
+        self._lock = new_lock()
         try:
             import RPi.GPIO as gpio  # type: ignore[import-not-found]
         except Exception as exc:  # noqa: BLE001
@@ -55,10 +51,13 @@ class RpiPwmOutput(PwmOutput):
             ) from exc
 
         # Настройка GPIO выполняется один раз при создании объекта.
-        self._gpio = gpio
+        self._gpio: Any = gpio
         self._gpio.setmode(self._gpio.BCM)
         self._gpio.setup(self.pin, self._gpio.OUT)
-        self._pwm = self._gpio.PWM(self.pin, self.frequency_hz)
+        self._pwm: Any = self._gpio.PWM(self.pin, self.frequency_hz)
+
+    def __repr__(self) -> str:
+        return f"RpiPwmOutput(pin={self.pin}, frequency_hz={self.frequency_hz})"
 
     def start(self, duty_cycle_percent: float) -> None:
         with self._lock:
@@ -68,12 +67,14 @@ class RpiPwmOutput(PwmOutput):
 
     def change_duty_cycle(self, duty_cycle_percent: float) -> None:
         with self._lock:
-            # Некоторые реализации требуют start() перед первым ChangeDutyCycle().
-            if not self._started:
-                self._pwm.start(float(duty_cycle_percent))
-                self._started = True
+            # Частый случай — PWM уже запущен: проверяем его первым.
+            # LedController всегда передаёт float, поэтому без float(...).
+            if self._started:
+                self._pwm.ChangeDutyCycle(duty_cycle_percent)
                 return
-            self._pwm.ChangeDutyCycle(float(duty_cycle_percent))
+            # Некоторые реализации требуют start() перед первым ChangeDutyCycle().
+            self._pwm.start(duty_cycle_percent)
+            self._started = True
 
     def stop(self) -> None:
         with self._lock:
@@ -81,11 +82,26 @@ class RpiPwmOutput(PwmOutput):
                 self._pwm.stop()
             self._started = False
 
+    def apply(self, duty_cycle_percent: float) -> None:
+        with self._lock:
+            if duty_cycle_percent <= 0.0:
+                if self._started:
+                    self._pwm.stop()
+                self._started = False
+            elif self._started:
+                self._pwm.ChangeDutyCycle(duty_cycle_percent)
+            else:
+                self._pwm.start(duty_cycle_percent)
+                self._started = True
+
     def close(self) -> None:
+        # Остановка и cleanup — одна секция под lock: другой поток не увидит
+        # остановленный, но ещё не освобождённый пин.
         with self._lock:
             try:
-                # Закрытие всегда пытается остановить PWM, даже если уже остановлен.
-                self.stop()
+                if self._started:
+                    self._pwm.stop()
+                self._started = False
             finally:
                 # cleanup освобождает пин, чтобы последующие запуски не “залипали”.
                 self._gpio.cleanup(self.pin)
@@ -1,14 +1,20 @@
 """Конфигурация логирования.
 
-Логирование в проекте настраивается централизованно через dictConfig, чтобы:
+Логирование в проекте настраивается централизованно через logging.basicConfig,
+чтобы:
 - получить единый формат сообщений во всех модулях,
 - не зависеть от сторонних библиотек/обвязок,
 - позволить тестам и CLI-скриптам включать логирование одинаково.
 
+Почему basicConfig, а не dictConfig: конфигурация здесь — один консольный
+обработчик на корневом логгере, а dictConfig ради этого тянет logging.config
+(и logging.handlers) и разбирает схему словаря. На Raspberry Pi это заметная
+часть времени старта, особенно для бота, который перезапускается systemd.
+
 Мы сознательно используем “корневой” логгер:
 - все модули пишут через logging.getLogger(<name>),
 - уровень и обработчики задаются один раз,
-- disable_existing_loggers=False оставляет логи зависимостей видимыми (если нужно).
+- логгеры зависимостей не отключаются, их сообщения остаются видимыми.
 
 Примечание: если захочется более продвинутой схемы (JSON-логи, file handler,
 ротация, структурированные поля), это расширяется в одном месте.
@@ -17,33 +23,29 @@
 from __future__ import annotations
 
 import logging
-import logging.config
+import sys
+
+# Формат не выводит поток/процесс, поэтому LogRecord не должен их собирать:
+# иначе на каждую запись вызываются threading.current_thread() и os.getpid().
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 
 def configure_logging(level: str) -> None:
     """Настроить логирование приложения для вывода в консоль."""
 
-    # dictConfig позволяет описать конфигурацию как обычный dict,
-    # который легко сериализовать/шарить между окружениями.
-    logging.config.dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "default": {
-                    # Формат выбран “человеческий”: время, уровень,
-                    # имя логгера и сообщение.
-                    "format": "%(asctime)s %(levelname)s %(name)s: %(message)s",
-                }
-            },
-            "handlers": {
-                "console": {
-                    # StreamHandler пишет в stderr, что удобно для контейнеров/сервисов.
-                    "class": "logging.StreamHandler",
-                    "formatter": "default",
-                }
-            },
-            # Корневой логгер: единая точка, куда сходятся все логи.
-            "root": {"handlers": ["console"], "level": level},
-        }
+    # stderr удобен для контейнеров/сервисов.
+    handler = logging.StreamHandler(sys.stderr)
+    # Уровень задаётся и обработчику: записи ниже уровня, пришедшие
+    # от логгеров со своим уровнем, отбрасываются до форматирования.
+    handler.setLevel(level)
+    logging.basicConfig(
+        level=level,
+        # Формат выбран “человеческий”: время, уровень, имя логгера и сообщение.
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        handlers=[handler],
+        # force=True: заменяем ранее установленные обработчики корневого логгера,
+        # чтобы повторный вызов (например, в тестах) не дублировал вывод.
+        force=True,
     )
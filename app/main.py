@@ -7,6 +7,7 @@ python -m app.main
 В отличие от запуска через `uvicorn app.api.app:app`, здесь можно удобно:
 - включить HTTPS (ssl_certfile / ssl_keyfile из Settings),
 - передать host/port через переменные окружения,
+- запустить сервер на uvloop + httptools, если они есть (см. uvicorn_kwargs()),
 - сохранить единый способ запуска в Docker/на железе.
 
 Примечание:
@@ -18,14 +19,17 @@ from __future__ import annotations
 
 import os
 
-import uvicorn
-
-from app.api.factory import create_app
 from app.config import Settings
 
 
 def main() -> None:
     """Запустить HTTP(S) сервер Uvicorn с настройками из окружения."""
+    # uvicorn и FastAPI-приложение импортируются только при реальном запуске:
+    # импорт модуля (например, для проверки или из тестов) остаётся дешёвым.
+    import uvicorn
+
+    from app.api.factory import create_app, uvicorn_kwargs
+
     settings = Settings()  # type: ignore[call-arg]
     # Эти переменные не входят в Settings, потому что относятся к “процессу сервера”,
     # а не к доменной конфигурации устройства.
@@ -40,6 +44,7 @@ def main() -> None:
         ssl_certfile=settings.ssl_certfile,
         ssl_keyfile=settings.ssl_keyfile,
         proxy_headers=True,
+        **uvicorn_kwargs(settings),
     )
 
 
@@ -8,17 +8,25 @@
 
 Клиент использует Bearer-токен (как и веб UI):
 Authorization: Bearer <token>
+
+Один httpx.AsyncClient живёт всё время работы бота: соединение (и TLS-сессия)
+переиспользуется между командами, а не открывается заново на каждый запрос.
+После остановки бота клиент нужно закрыть через aclose().
+
+HTTP/2 включён на стороне клиента: если сервер его поддерживает (ALPN),
+параллельные команды идут по одному соединению. Uvicorn отвечает по
+HTTP/1.1 — тогда httpx сам откатывается на HTTP/1.1 keep-alive.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 import httpx
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class NightlightApiClient:
     """Клиент, который умеет делать базовые операции над ночником.
 
@@ -36,43 +44,57 @@ tls_verify:
     api_token: str
     device_id: str
     tls_verify: bool = True
+    _client: httpx.AsyncClient = field(init=False, repr=False)
+    _state_path: str = field(init=False, repr=False)
+    _power_path: str = field(init=False, repr=False)
+    _brightness_path: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Заголовок Authorization задаётся один раз на клиент и уходит
+        # с каждым запросом автоматически.
+        # Когда передан transport, verify/limits/http2 задаются именно на нём.
+        # retries=1 — одна повторная попытка установить соединение.
+        transport = httpx.AsyncHTTPTransport(
+            verify=self.tls_verify,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            retries=1,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=10.0,
+            headers={"Authorization": f"Bearer {self.api_token}"},
+            transport=transport,
+        )
+        # device_id не меняется, поэтому пути собираются один раз,
+        # а не f-строкой на каждый запрос.
+        device_path = f"/api/v1/devices/{self.device_id}"
+        self._state_path = f"{device_path}/state"
+        self._power_path = f"{device_path}/power"
+        self._brightness_path = f"{device_path}/brightness"
+
+    async def aclose(self) -> None:
+        """Закрыть HTTP-клиент и его соединения."""
+        await self._client.aclose()
 
     async def get_state(self) -> dict[str, Any]:
         """Получить текущее состояние устройства."""
-        async with httpx.AsyncClient(
-            base_url=self.base_url, timeout=10.0, verify=self.tls_verify
-        ) as client:
-            resp = await client.get(
-                f"/api/v1/devices/{self.device_id}/state",
-                # Токен передаётся на каждый запрос, чтобы клиент был stateless.
-                headers={"Authorization": f"Bearer {self.api_token}"},
-            )
-            # Любая не-2xx ошибка превращается в исключение — это упрощает код бота.
-            resp.raise_for_status()
-            return cast(dict[str, Any], resp.json())
+        resp = await self._client.get(self._state_path)
+        # Любая не-2xx ошибка превращается в исключение — это упрощает код бота.
+        resp.raise_for_status()
+        return cast(dict[str, Any], resp.json())
 
     async def set_power(self, is_on: bool) -> dict[str, Any]:
         """Включить/выключить устройство и вернуть новое состояние."""
-        async with httpx.AsyncClient(
-            base_url=self.base_url, timeout=10.0, verify=self.tls_verify
-        ) as client:
-            resp = await client.post(
-                f"/api/v1/devices/{self.device_id}/power",
-                headers={"Authorization": f"Bearer {self.api_token}"},
-                json={"is_on": is_on},
-            )
-            resp.raise_for_status()
-            return cast(dict[str, Any], resp.json())
+        resp = await self._client.post(self._power_path, json={"is_on": is_on})
+        resp.raise_for_status()
+        return cast(dict[str, Any], resp.json())
 
     async def set_brightness(self, brightness: float) -> dict[str, Any]:
         """Установить яркость (0..1) и вернуть новое состояние."""
-        async with httpx.AsyncClient(
-            base_url=self.base_url, timeout=10.0, verify=self.tls_verify
-        ) as client:
-            resp = await client.post(
-                f"/api/v1/devices/{self.device_id}/brightness",
-                headers={"Authorization": f"Bearer {self.api_token}"},
-                json={"brightness": brightness},
-            )
-            resp.raise_for_status()
-            return cast(dict[str, Any], resp.json())
+        resp = await self._client.post(
+            self._brightness_path,
+            json={"brightness": brightness},
+        )
+        resp.raise_for_status()
+        return cast(dict[str, Any], resp.json())
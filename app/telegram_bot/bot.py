@@ -4,7 +4,8 @@
 Архитектура намеренно простая:
 - BotContext хранит всё “состояние” (HTTP-клиент + список разрешённых чатов),
 - каждая команда Telegram вызывает соответствующий метод API,
-- ответы формируются как обычный текст (без сложных клавиатур).
+- ответы формируются как обычный текст (без сложных клавиатур),
+- пока идёт запрос к API, пользователю параллельно показывается “печатает…”.
 
 Зачем бот ходит в API, а не напрямую в GPIO:
 - API остаётся единственной точкой управления устройством,
@@ -14,10 +15,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, cast
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any, Final, TypeVar, cast
 
-from telegram import Update
+from telegram import Message, Update
+from telegram.constants import ChatAction
 from telegram.ext import (
     Application,
     ApplicationBuilder,
@@ -29,12 +34,38 @@ from app.config import Settings
 
 from .api_client import NightlightApiClient
 
+_T = TypeVar("_T")
+
+# Тексты ответов. Фиксированные строки — константы модуля, а ответы с
+# процентами заранее собраны для всех 101 значений и берутся по индексу.
+_DENIED: Final = "Доступ запрещён."
+_HELP: Final = "Команды: /status, /on, /off, /brightness 0-100"
+_OFF_MSG: Final = "Выключено"
+_BRIGHTNESS_USAGE: Final = "Использование: /brightness 0-100"
+_BRIGHTNESS_INVALID: Final = "Нужно число 0-100"
+_ON_MSGS: Final = tuple(f"Включено, яркость {i}%" for i in range(101))
+_SET_MSGS: Final = tuple(f"Установлено {i}%" for i in range(101))
+# Индекс [is_on][percent]: False -> OFF, True -> ON.
+_STATUS_MSGS: Final = (
+    tuple(f"Состояние: OFF, яркость {i}%" for i in range(101)),
+    tuple(f"Состояние: ON, яркость {i}%" for i in range(101)),
+)
+
 
 @dataclass(frozen=True, slots=True)
 class BotContext:
-    """Контекст бота, общий для всех обработчиков."""
+    """Контекст бота, общий для всех обработчиков.
+
+allowed_chat_ids не меняется за время работы бота, поэтому признак
+“разрешено всем” (пустой allowlist) вычисляется один раз при создании.
+"""
     api: NightlightApiClient
-    allowed_chat_ids: set[int]
+    allowed_chat_ids: frozenset[int]
+    allow_all: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        # frozen dataclass: вычисляемое поле выставляем через object.__setattr__.
+        object.__setattr__(self, "allow_all", not self.allowed_chat_ids)
 
 
 def parse_brightness_arg(value: str) -> float:
@@ -65,9 +96,17 @@ def create_bot(settings: Settings) -> Application[Any, Any, Any, Any, Any, Any]:
         tls_verify=settings.telegram_tls_verify,
     )
     # Ограничиваем доступ по chat_id, чтобы бот не управлялся “всем интернетом”.
-    ctx = BotContext(api=api, allowed_chat_ids=settings.allowed_chat_ids())
+    ctx = BotContext(
+        api=api, allowed_chat_ids=frozenset(settings.allowed_chat_ids())
+    )
 
-    application = ApplicationBuilder().token(settings.telegram_bot_token).build()
+    application = (
+        ApplicationBuilder()
+        .token(settings.telegram_bot_token)
+        # После остановки polling закрываем HTTP-клиент и его соединения.
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
     # BotData — стандартное место, где python-telegram-bot хранит произвольные данные.
     application.bot_data["ctx"] = ctx
 
@@ -80,6 +119,20 @@ def create_bot(settings: Settings) -> Application[Any, Any, Any, Any, Any, Any]:
     return application
 
 
+async def _post_shutdown(
+    application: Application[Any, Any, Any, Any, Any, Any],
+) -> None:
+    """Освободить ресурсы BotContext при остановке бота."""
+    await cast(BotContext, application.bot_data["ctx"]).api.aclose()
+
+
+def _percent(state: dict[str, Any]) -> int:
+    """Яркость из ответа API (0..1) в целых процентах 0..100."""
+    percent = int(round(float(state.get("brightness", 0.0)) * 100))
+    # API гарантирует 0..1, но индекс в таблицах ответов не должен “вылетать”.
+    return 0 if percent < 0 else 100 if percent > 100 else percent
+
+
 def _ctx(context: ContextTypes.DEFAULT_TYPE) -> BotContext:
     """Достать BotContext из application.bot_data."""
     return cast(BotContext, context.application.bot_data["ctx"])
@@ -90,88 +143,135 @@ def _is_allowed(update: Update, ctx: BotContext) -> bool:
     chat = update.effective_chat
     if chat is None:
         return False
-    if not ctx.allowed_chat_ids:
+    if ctx.allow_all:
         # Пустой allowlist означает “разрешено всем”
         # (удобно для локальных экспериментов).
         return True
     return chat.id in ctx.allowed_chat_ids
 
 
-async def _start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+_Command = Callable[
+    [Update, ContextTypes.DEFAULT_TYPE, BotContext, Message], Awaitable[None]
+]
+_Handler = Callable[[Update, ContextTypes.DEFAULT_TYPE], Coroutine[Any, Any, None]]
+
+
+def require_allowed(fn: _Command) -> _Handler:
+    """Обернуть команду общей проверкой доступа.
+
+Обёртка достаёт BotContext и сообщение, отбрасывает апдейты без сообщения и
+отвечает “Доступ запрещён.” чужим чатам. Сама команда получает уже
+проверенные ctx и message и содержит только свою логику.
+"""
+
+    @functools.wraps(fn)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        ctx = _ctx(context)
+        message = update.effective_message
+        if message is None:
+            return
+        if not _is_allowed(update, ctx):
+            await message.reply_text(_DENIED)
+            return
+        await fn(update, context, ctx, message)
+
+    return wrapper
+
+
+# Фоновые задачи “печатает…”: event loop держит на задачи только слабые
+# ссылки, поэтому сильные храним здесь, пока задача не завершится.
+_typing_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _forget_typing(task: asyncio.Task[Any]) -> None:
+    """Убрать завершённую задачу “печатает…” и проглотить её ошибку."""
+
+    _typing_tasks.discard(task)
+    if not task.cancelled():
+        # Статус чисто косметический: ошибка (например, RetryAfter от flood
+        # control Telegram) не должна ломать команду. Забираем исключение,
+        # чтобы asyncio не писал “Task exception was never retrieved”.
+        task.exception()
+
+
+async def _with_typing(message: Message, call: Awaitable[_T]) -> _T:
+    """Выполнить вызов API, параллельно отправляя в чат статус “печатает…”.
+
+Статус уходит отдельной фоновой задачей: он не добавляет задержки, а его
+ошибки не влияют на команду. Ответ пользователю отправляется только после
+успешного ответа API.
+"""
+    task = asyncio.create_task(message.chat.send_action(ChatAction.TYPING))
+    _typing_tasks.add(task)
+    task.add_done_callback(_forget_typing)
+    return await call
+
+
+@require_allowed
+async def _start(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ctx: BotContext,
+    message: Message,
+) -> None:
     """Команда /start: показывает подсказку по командам."""
-    ctx = _ctx(context)
-    message = update.effective_message
-    if message is None:
-        return
-    if not _is_allowed(update, ctx):
-        await message.reply_text("Доступ запрещён.")
-        return
-    await message.reply_text("Команды: /status, /on, /off, /brightness 0-100")
+    await message.reply_text(_HELP)
 
 
-async def _status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@require_allowed
+async def _status(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ctx: BotContext,
+    message: Message,
+) -> None:
     """Команда /status: читает состояние из API и показывает его пользователю."""
-    ctx = _ctx(context)
-    message = update.effective_message
-    if message is None:
-        return
-    if not _is_allowed(update, ctx):
-        await message.reply_text("Доступ запрещён.")
-        return
     # API возвращает JSON с is_on/brightness.
-    state = await ctx.api.get_state()
-    brightness = int(round(float(state.get("brightness", 0.0)) * 100))
+    state = await _with_typing(message, ctx.api.get_state())
     is_on = bool(state.get("is_on", False))
-    await message.reply_text(
-        f"Состояние: {'ON' if is_on else 'OFF'}, яркость {brightness}%"
-    )
+    await message.reply_text(_STATUS_MSGS[is_on][_percent(state)])
 
 
-async def _on(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@require_allowed
+async def _on(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ctx: BotContext,
+    message: Message,
+) -> None:
     """Команда /on: включает устройство."""
-    ctx = _ctx(context)
-    message = update.effective_message
-    if message is None:
-        return
-    if not _is_allowed(update, ctx):
-        await message.reply_text("Доступ запрещён.")
-        return
-    state = await ctx.api.set_power(True)
-    brightness = int(round(float(state.get("brightness", 0.0)) * 100))
-    await message.reply_text(f"Включено, яркость {brightness}%")
+    state = await _with_typing(message, ctx.api.set_power(True))
+    await message.reply_text(_ON_MSGS[_percent(state)])
 
 
-async def _off(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@require_allowed
+async def _off(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ctx: BotContext,
+    message: Message,
+) -> None:
     """Команда /off: выключает устройство."""
-    ctx = _ctx(context)
-    message = update.effective_message
-    if message is None:
-        return
-    if not _is_allowed(update, ctx):
-        await message.reply_text("Доступ запрещён.")
-        return
-    await ctx.api.set_power(False)
-    await message.reply_text("Выключено")
+    await _with_typing(message, ctx.api.set_power(False))
+    await message.reply_text(_OFF_MSG)
 
 
-async def _brightness(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@require_allowed
+async def _brightness(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ctx: BotContext,
+    message: Message,
+) -> None:
     """Команда /brightness 0-100: задаёт яркость в процентах."""
-    ctx = _ctx(context)
-    message = update.effective_message
-    if message is None:
-        return
-    if not _is_allowed(update, ctx):
-        await message.reply_text("Доступ запрещён.")
-        return
     if not context.args:
-        await message.reply_text("Использование: /brightness 0-100")
+        await message.reply_text(_BRIGHTNESS_USAGE)
         return
     try:
         brightness01 = parse_brightness_arg(context.args[0])
     except ValueError:
         # Пользователь мог прислать не число.
-        await message.reply_text("Нужно число 0-100")
+        await message.reply_text(_BRIGHTNESS_INVALID)
         return
-    state = await ctx.api.set_brightness(brightness01)
-    brightness = int(round(float(state.get("brightness", 0.0)) * 100))
-    await message.reply_text(f"Установлено {brightness}%")
+    state = await _with_typing(message, ctx.api.set_brightness(brightness01))
+    await message.reply_text(_SET_MSGS[_percent(state)])
@@ -3,7 +3,8 @@
 Запускается отдельно от API-сервиса и управляет устройством через HTTP:
 - читает настройки из окружения (Settings),
 - создаёт Telegram Application,
-- запускает polling (бот сам опрашивает Telegram API).
+- запускает polling (бот сам опрашивает Telegram API) на event loop uvloop,
+  если он доступен (на Windows его нет — тогда используется обычный asyncio).
 
 Почему polling, а не webhook:
 - проще для MVP (не нужен публичный URL для самого бота),
@@ -13,17 +14,32 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from app.config import Settings
 from app.logging_config import configure_logging
 
-from .bot import create_bot
+
+def _install_uvloop() -> None:
+    """Сделать uvloop event loop по умолчанию, если он установлен."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    # run_polling() создаёт loop через текущую политику asyncio.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
     """Запустить Telegram-бота в режиме polling."""
+    # python-telegram-bot и httpx тянут большой граф импортов, поэтому
+    # модуль бота загружается только здесь, а не при импорте main.
+    from .bot import create_bot
+
     settings = Settings()  # type: ignore[call-arg]
     # Используем те же настройки логирования, что и у API, чтобы логи были единообразны.
     configure_logging(settings.log_level)
+    _install_uvloop()
     bot = create_bot(settings)
     # close_loop=False: оставляем управление event loop библиотеке,
     # чтобы избежать конфликтов.
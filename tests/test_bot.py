@@ -0,0 +1,54 @@
+"""Тесты обработчиков Telegram-бота на фейковых Update/API."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.telegram_bot import bot
+
+
+class FakeApi:
+    """Подмена NightlightApiClient: запоминает вызовы и отвечает сразу."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    async def set_power(self, is_on: bool) -> dict[str, Any]:
+        self.calls.append(("set_power", is_on))
+        return {"is_on": is_on, "brightness": 1.0 if is_on else 0.0}
+
+
+def _make_update(send_action: Any) -> tuple[Any, Any, list[str], FakeApi]:
+    replies: list[str] = []
+
+    async def reply_text(text: str) -> None:
+        replies.append(text)
+
+    chat = SimpleNamespace(id=1, send_action=send_action)
+    message = SimpleNamespace(reply_text=reply_text, chat=chat)
+    update = SimpleNamespace(effective_message=message, effective_chat=chat)
+    api = FakeApi()
+    ctx = bot.BotContext(api=api, allowed_chat_ids=frozenset())  # type: ignore[arg-type]
+    context = SimpleNamespace(application=SimpleNamespace(bot_data={"ctx": ctx}))
+    return update, context, replies, api
+
+
+@pytest.mark.asyncio
+async def test_failing_typing_action_does_not_break_command() -> None:
+    async def send_action(action: str) -> None:
+        raise RuntimeError("flood control")
+
+    update, context, replies, api = _make_update(send_action)
+
+    await bot._off(update, context)
+    # Ждём фоновую задачу “печатает…”, затем один шаг loop на её done-callback.
+    await asyncio.gather(*bot._typing_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert api.calls == [("set_power", False)]
+    assert replies == ["Выключено"]
+    assert not bot._typing_tasks
@@ -0,0 +1,131 @@
+"""Тесты LedController: чтение состояния без lock при параллельной записи."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.gpio import locks
+from app.gpio.base import LedState
+from app.gpio.led import LedController
+from app.gpio.locks import GIL_ENABLED
+from app.gpio.mock_gpio import MockPwmOutput
+
+# Значения, которые пишет писатель. Читатель обязан видеть только их
+# (или начальное выключенное состояние), а не “смесь” двух записей.
+_WRITTEN = (0.0, 0.1, 0.25, 0.5, 0.75, 1.0)
+_ALLOWED = {LedState(is_on=b > 0.0, brightness=b) for b in _WRITTEN}
+
+
+def _race_reads(readers: int, writes: int) -> list[LedState]:
+    """Читать state() из нескольких потоков, пока один поток пишет яркость.
+
+Возвращает все “невозможные” состояния, которые увидели читатели.
+"""
+
+    led = LedController(MockPwmOutput(frequency_hz=800))
+    done = threading.Event()
+    bad: list[LedState] = []
+
+    def read() -> None:
+        while not done.is_set():
+            state = led.state()
+            if state not in _ALLOWED:
+                bad.append(state)
+
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    try:
+        for i in range(writes):
+            led.set_brightness(_WRITTEN[i % len(_WRITTEN)])
+    finally:
+        done.set()
+        for t in threads:
+            t.join()
+    return bad
+
+
+def test_state_reads_are_never_torn() -> None:
+    assert _race_reads(readers=4, writes=20_000) == []
+
+
+@pytest.mark.skipif(GIL_ENABLED, reason="нужна free-threaded сборка (PYTHON_GIL=0)")
+def test_state_reads_are_never_torn_free_threaded() -> None:
+    assert _race_reads(readers=8, writes=100_000) == []
+
+
+def _race_invariant(readers: int, writes: int) -> int:
+    """Один писатель включает/выключает LED и меняет яркость, читатели проверяют
+инвариант is_on == (brightness > 0). Возвращает число нарушений.
+"""
+
+    led = LedController(MockPwmOutput(frequency_hz=800))
+    done = threading.Event()
+    violations = 0
+
+    def read() -> None:
+        nonlocal violations
+        while not done.is_set():
+            state = led.state()
+            if state.is_on != (state.brightness > 0.0):
+                violations += 1
+
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    try:
+        for i in range(writes):
+            step = i % 4
+            if step == 0:
+                led.set_power(True)
+            elif step == 1:
+                led.set_brightness(0.3)
+            elif step == 2:
+                led.set_brightness(0.0)
+            else:
+                led.set_power(False)
+    finally:
+        done.set()
+        for t in threads:
+            t.join()
+    return violations
+
+
+def test_is_on_matches_brightness_for_concurrent_readers() -> None:
+    assert _race_invariant(readers=4, writes=20_000) == 0
+
+
+@pytest.mark.skipif(GIL_ENABLED, reason="нужна free-threaded сборка (PYTHON_GIL=0)")
+def test_is_on_matches_brightness_for_concurrent_readers_free_threaded() -> None:
+    assert _race_invariant(readers=8, writes=100_000) == 0
+
+
+@pytest.mark.parametrize("gil_enabled", [True, False], ids=["fastrlock", "rlock"])
+def test_concurrent_writers_keep_pwm_in_step_with_state(
+    monkeypatch: pytest.MonkeyPatch, gil_enabled: bool
+) -> None:
+    # Без GIL new_lock() отдаёт threading.RLock: проверяем обе ветки.
+    monkeypatch.setattr(locks, "GIL_ENABLED", gil_enabled)
+    pwm = MockPwmOutput(frequency_hz=800)
+    led = LedController(pwm)
+
+    def write(value: float) -> None:
+        for _ in range(2_000):
+            led.set_brightness(value)
+            led.set_power(False)
+            led.set_brightness(value)
+
+    threads = [
+        threading.Thread(target=write, args=(v,)) for v in (0.2, 0.4, 0.6, 0.8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Последняя команда PWM должна совпадать с последним опубликованным снимком.
+    state = led.state()
+    assert pwm.started is state.is_on
+    assert pwm.duty_cycle_percent == pytest.approx(state.brightness * 100.0)